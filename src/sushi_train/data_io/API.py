@@ -62,23 +62,17 @@ def add_query_params_to_url(base_url, params):
     if not params:
         return base_url
 
-    cleaned_params = {}
-    for name, value in params.items():
-        if value is None:
-            continue
-        cleaned_params[str(name)] = str(value)
-
-    if not cleaned_params:
+    items = [(name, value) for name, value in params.items() if value is not None]
+    if not items:
         return base_url
 
-    encoded_query = urlencode(cleaned_params, doseq=True)
+    encoded_query = urlencode(items, doseq=True)
 
-    if base_url.endswith('?') or base_url.endswith('&'):
-        separator = ''
-    elif '?' in base_url:
-        separator = '&'
-    else:
-        separator = '?'
+    # At most one scan of the URL: the last-char check is O(1), and the
+    # '?' membership scan only runs when the URL doesn't already end in a
+    # separator. The truthiness guard keeps an empty URL getting a '?'
+    # ('' in '?&' is True, so a bare last-char check would skip it).
+    separator = '' if (base_url and base_url[-1] in '?&') else ('&' if '?' in base_url else '?')
 
     result = f"{base_url}{separator}{encoded_query}"
     return result
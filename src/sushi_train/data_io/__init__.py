@@ -1,4 +1,4 @@
-from .minio import write_data_to_minio_from_parquet_buffer
+from .minio import write_data_to_minio_from_parquet_buffer, write_dataframe_to_minio
 from .duckdb import (
     duckdb_memory_con_init,
     ducklake_init,
@@ -1,22 +1,36 @@
 import duckdb
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_POOLED_CON = None
+_POOLED_CON_LOCK = threading.Lock()
 
 def duckdb_memory_con_init():
     """
-    Initialize a DuckDB in-memory connection and load required extensions.
+    Return a cursor on a shared in-memory DuckDB connection.
 
-    This function installs and loads the `ducklake` and `httpfs` extensions
-    then returns a fresh in-memory DuckDB connection.
+    The first call creates the connection and installs/loads the `ducklake`
+    and `httpfs` extensions; later calls hand out `cursor()` duplicates of
+    the same connection, so extension load cost and DuckDB's HTTP metadata
+    cache stay warm across jobs. Each cursor has its own transaction context
+    and can be used like an independent connection. Initialization is
+    serialized behind a lock so concurrent first calls from worker threads
+    share one connection instead of racing to build two.
 
     Returns
-    - con: a duckdb.Connection instance connected to ':memory:'.
+    - con: a duckdb cursor on the shared ':memory:' connection.
     """
-    duckdb.install_extension("ducklake")
-    duckdb.install_extension("httpfs")
-    duckdb.load_extension("ducklake")
-    duckdb.load_extension("httpfs")
-    con = duckdb.connect(':memory:')
-    return con
+    global _POOLED_CON
+    with _POOLED_CON_LOCK:
+        if _POOLED_CON is None:
+            con = duckdb.connect(':memory:')
+            con.install_extension("ducklake")
+            con.install_extension("httpfs")
+            con.load_extension("ducklake")
+            con.load_extension("httpfs")
+            _POOLED_CON = con
+    return _POOLED_CON.cursor()
 
 def ducklake_init(con, data_path, catalog_path):
     """
@@ -39,6 +53,11 @@ def ducklake_attach_minio(con, minio_access_key, minio_secret_key, minio_endpoin
     - minio_access_key: access key id for MinIO
     - minio_secret_key: secret key for MinIO
     - minio_endpoint: endpoint URL or host for MinIO
+
+    Notes
+    - DuckDB does not accept prepared-statement parameters in SET, so the
+      credential values are interpolated into the statement text. Keep that
+      in mind if statements are ever logged.
     """
     con.execute(f"SET s3_access_key_id = '{minio_access_key}'")
     con.execute(f"SET s3_secret_access_key = '{minio_secret_key}'")
@@ -53,9 +72,11 @@ def ducklake_medallion_schema_creation(con):
     Parameters
     - con: duckdb connection
     """
-    con.execute("CREATE SCHEMA IF NOT EXISTS RAW")
-    con.execute("CREATE SCHEMA IF NOT EXISTS STAGED")
-    con.execute("CREATE SCHEMA IF NOT EXISTS CLEANED")
+    con.execute(
+        "CREATE SCHEMA IF NOT EXISTS RAW;"
+        "CREATE SCHEMA IF NOT EXISTS STAGED;"
+        "CREATE SCHEMA IF NOT EXISTS CLEANED"
+    )
 
 def ducklake_refresh(con):
     """
@@ -79,40 +100,56 @@ def update_ducklake_from_minio_parquets(con, bucket_name, source_folder_path, ta
     - target_folder_path: target schema or path in DuckLake where tables are created
 
     Behavior
+    - Applies bulk-load session settings first: insertion order is not
+      preserved (so scans stay parallel), threads match the core count, and
+      DuckDB's HTTP metadata/object caches are enabled to avoid repeat
+      parquet-footer fetches
     - Uses `glob` to list parquet files in the source path
-    - For each parquet file, creates or replaces a table named after the file
-      (uppercased, hyphens/spaces replaced with underscores)
+    - Groups files by table name (uppercased, hyphens/spaces replaced with
+      underscores) and creates or replaces each table with a single batched
+      statement, letting DuckDB parallelize parquet metadata and column reads
+      instead of issuing one query per file
+    - Independent tables are ingested concurrently on duplicated cursors
+      (`con.cursor()`), so S3 reads for one table overlap with another's
     - Adds metadata columns: _source_file, _ingestion_timestamp, _record_id
-
-    Raises
-    - Re-raises any exception encountered while listing or creating tables.
+      (_record_id is a hash of filename and row position, so the scan stays
+      pipelined instead of paying a global ROW_NUMBER() window sort)
     """
     file_list_query = f"SELECT * FROM glob('s3://{bucket_name}/{source_folder_path}/*.parquet')"
 
-    try:
-        files_result = con.execute(file_list_query).fetchall()
-        file_paths = []
-        for row in files_result:
-            file_paths.append(row[0])
-        
-        for file_path in file_paths:
-            file_name = os.path.basename(file_path).replace('.parquet', '')
-            table_name = file_name.upper().replace('-', '_').replace(' ', '_')
-
-            query = f"""
-            CREATE OR REPLACE TABLE {target_folder_path}.{table_name} AS
-            SELECT 
-                *,
-                '{file_name}' AS _source_file,
-                CURRENT_TIMESTAMP AS _ingestion_timestamp,
-                ROW_NUMBER() OVER () AS _record_id
-            FROM read_parquet('{file_path}');
-            """
-            
-            con.execute(query)
+    con.execute(
+        "SET preserve_insertion_order=false;"
+        f"SET threads TO {os.cpu_count()};"
+        "SET enable_http_metadata_cache=true;"
+        "SET enable_object_cache=true"
+    )
+    file_paths = [row[0] for row in con.execute(file_list_query).fetchall()]
+
+    tables = {}
+    for file_path in file_paths:
+        file_name = os.path.basename(file_path).replace('.parquet', '')
+        table_name = file_name.upper().replace('-', '_').replace(' ', '_')
+        tables.setdefault(table_name, []).append(file_path)
+
+    def ingest_one(cursor, table_name, table_files):
+        query = f"""
+        CREATE OR REPLACE TABLE {target_folder_path}.{table_name} AS
+        SELECT
+            * EXCLUDE (filename, file_row_number),
+            regexp_extract(filename, '([^/]+)\\.parquet$', 1) AS _source_file,
+            CURRENT_TIMESTAMP AS _ingestion_timestamp,
+            hash(filename, file_row_number) AS _record_id
+        FROM read_parquet(?, filename=true, file_row_number=true, union_by_name=true, hive_partitioning=false);
+        """
+        cursor.execute(query, [table_files])
 
-    except Exception as e:
-        raise
+    if tables:
+        with ThreadPoolExecutor(max_workers=min(8, len(tables))) as executor:
+            futures = []
+            for table_name, table_files in tables.items():
+                futures.append(executor.submit(ingest_one, con.cursor(), table_name, table_files))
+            for future in futures:
+                future.result()
 
 
 def update_ducklake_from_minio_csvs(con, bucket_name, source_folder_path, target_folder_path):
@@ -136,33 +173,26 @@ def update_ducklake_from_minio_csvs(con, bucket_name, source_folder_path, target
         - This uses DuckDB's `read_csv_auto` to infer schema; if you require explicit
             options (delimiter, header, etc.) pass `csv_options` as a dict and use
             alternative read approaches as needed.
-
-        Raises
-        - Re-raises any exception encountered while listing or creating tables.
         """
         file_list_query = f"SELECT * FROM glob('s3://{bucket_name}/{source_folder_path}/*.csv')"
 
-        try:
-                files_result = con.execute(file_list_query).fetchall()
-                file_paths = []
-                for row in files_result:
-                        file_paths.append(row[0])
-
-                for file_path in file_paths:
-                        file_name = os.path.basename(file_path).replace('.csv', '')
-                        table_name = file_name.upper().replace('-', '_').replace(' ', '_')
-
-                        query = f"""
-                        CREATE OR REPLACE TABLE {target_folder_path}.{table_name} AS
-                        SELECT
-                                *,
-                                '{file_name}' AS _source_file,
-                                CURRENT_TIMESTAMP AS _ingestion_timestamp,
-                                ROW_NUMBER() OVER () AS _record_id
-                        FROM read_csv_auto('{file_path}');
-                        """
-
-                        con.execute(query)
-
-        except Exception as e:
-                raise
\ No newline at end of file
+        files_result = con.execute(file_list_query).fetchall()
+        file_paths = []
+        for row in files_result:
+                file_paths.append(row[0])
+
+        for file_path in file_paths:
+                file_name = os.path.basename(file_path).replace('.csv', '')
+                table_name = file_name.upper().replace('-', '_').replace(' ', '_')
+
+                query = f"""
+                CREATE OR REPLACE TABLE {target_folder_path}.{table_name} AS
+                SELECT
+                        *,
+                        '{file_name}' AS _source_file,
+                        CURRENT_TIMESTAMP AS _ingestion_timestamp,
+                        ROW_NUMBER() OVER () AS _record_id
+                FROM read_csv_auto('{file_path}');
+                """
+
+                con.execute(query)
\ No newline at end of file
@@ -1,36 +1,129 @@
+import contextlib
 import io
+import os
+import threading
 
 
-def write_data_to_minio_from_parquet_buffer(parquet_buffer, minio_client, bucket_name, object_name, folder_name=None):    
+class _PipeWriteStream(io.RawIOBase):
     """
-    Upload a parquet binary buffer to MinIO as an object.
+    Write-only wrapper around the write end of a pipe.
+
+    Polars' parquet writer seeks any target that exposes fileno(), and a
+    pipe cannot seek. This wrapper hides the descriptor and forwards plain
+    write() calls only, so the writer falls back to its streaming path.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self._raw.write(data)
+
+    def close(self):
+        try:
+            self._raw.close()
+        finally:
+            super().close()
+
+
+def write_dataframe_to_minio(dataframe, minio_client, bucket_name, object_name, folder_name=None, part_size=16 * 1024 * 1024):
+    """
+    Write a Polars DataFrame straight to MinIO as a parquet object.
+
+    Unlike converting to a parquet buffer first and uploading that, this
+    streams row groups through a pipe into a multipart upload, so peak
+    memory stays at roughly one part rather than the whole file, and
+    compression overlaps with the upload.
 
     Parameters
-    - parquet_buffer: io.BytesIO containing parquet bytes (will be seeked to 0)
+    - dataframe: Polars DataFrame to write
     - minio_client: an instantiated MinIO client with put_object method
     - bucket_name: target bucket name
     - object_name: desired object name (filename)
     - folder_name: optional folder inside bucket to place the object
+    - part_size: multipart part size in bytes (default 16 MB)
 
     Raises
-    - Re-raises any exception from the MinIO client.
+    - Re-raises any exception from the parquet writer or the MinIO client.
     """
-    parquet_buffer.seek(0)
-    data_bytes = parquet_buffer.read()
-
     if folder_name:
         folder_name = folder_name.strip("/")
         full_object_name = f"{folder_name}/{object_name}"
     else:
         full_object_name = object_name
 
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, "rb")
+    writer = _PipeWriteStream(os.fdopen(write_fd, "wb"))
+    upload_error = []
+
+    def upload():
+        try:
+            minio_client.put_object(
+                bucket_name,
+                full_object_name,
+                reader,
+                length=-1,
+                part_size=part_size,
+                content_type="application/x-parquet",
+            )
+        except Exception as e:
+            upload_error.append(e)
+        finally:
+            reader.close()
+
+    upload_thread = threading.Thread(target=upload)
+    upload_thread.start()
+    write_error = None
     try:
-        minio_client.put_object(
-            bucket_name,
-            full_object_name,
-            io.BytesIO(data_bytes),
-            length=len(data_bytes),
-            content_type="application/x-parquet",
-        )
+        dataframe.write_parquet(writer, compression="zstd")
     except Exception as e:
-        raise
\ No newline at end of file
+        # If the upload thread died first, the writer only sees the broken
+        # pipe; the upload error below is the real cause and wins.
+        write_error = e
+    finally:
+        # Closing flushes buffered bytes; if the upload thread already died
+        # and closed the read end, that flush hits a dead pipe. Suppress it
+        # so the upload thread's exception is the one raised below.
+        with contextlib.suppress(OSError):
+            writer.close()
+        upload_thread.join()
+
+    if upload_error:
+        raise upload_error[0]
+    if write_error:
+        raise write_error
+
+
+def write_data_to_minio_from_parquet_buffer(parquet_buffer, minio_client, bucket_name, object_name, folder_name=None):    
+    """
+    Upload a parquet binary buffer to MinIO as an object.
+
+    Parameters
+    - parquet_buffer: io.BytesIO containing parquet bytes (will be seeked to 0);
+      the upload reads from this buffer directly, so no intermediate copy of
+      the payload is made
+    - minio_client: an instantiated MinIO client with put_object method
+    - bucket_name: target bucket name
+    - object_name: desired object name (filename)
+    - folder_name: optional folder inside bucket to place the object
+    """
+    parquet_buffer.seek(0)
+    length = parquet_buffer.getbuffer().nbytes
+
+    if folder_name:
+        folder_name = folder_name.strip("/")
+        full_object_name = f"{folder_name}/{object_name}"
+    else:
+        full_object_name = object_name
+
+    minio_client.put_object(
+        bucket_name,
+        full_object_name,
+        parquet_buffer,
+        length=length,
+        content_type="application/x-parquet",
+    )
\ No newline at end of file
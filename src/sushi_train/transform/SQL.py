@@ -1,8 +1,16 @@
-import sys
 import os
+from functools import lru_cache
+
+# Base directory for resolving relative SQL file paths (the package root).
 current_path = os.path.dirname(os.path.abspath(__file__))
 parent_path = os.path.abspath(os.path.join(current_path, ".."))
-sys.path.append(parent_path)
+
+
+@lru_cache(maxsize=256)
+def _read_sql(full_path, mtime_ns):
+    with open(full_path, 'r') as file:
+        return file.read()
+
 
 def execute_SQL_file_list(con, list_of_file_paths):
     """
@@ -18,15 +26,35 @@ def execute_SQL_file_list(con, list_of_file_paths):
     """
     for file_path in list_of_file_paths:
         full_path = os.path.join(parent_path, file_path)
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(full_path)
+        sql = _read_sql(full_path, os.stat(full_path).st_mtime_ns)
+        con.execute(sql)
+
+def execute_SQL_file_list_batched(con, list_of_file_paths):
+    """
+    Execute a list of SQL files as one multi-statement batch.
+
+    Reads every file up front, joins the statements with ';' and sends a
+    single execute call, so the per-call parse/transaction overhead is paid
+    once instead of per file. Use `execute_SQL_file_list` when per-file
+    error attribution matters more than speed.
+
+    Parameters
+    - con: connection object to execute SQL on.
+    - list_of_file_paths: iterable of file paths (relative to project parent) containing SQL statements.
+
+    Raises
+    - FileNotFoundError: if any SQL file is missing.
+    - Exception: re-raises underlying execution errors.
+    """
+    sql_parts = []
+    for file_path in list_of_file_paths:
+        full_path = os.path.join(parent_path, file_path)
+        sql_parts.append(_read_sql(full_path, os.stat(full_path).st_mtime_ns))
+
+    if not sql_parts:
+        return
+    con.execute(";\n".join(sql_parts))
 
-        with open(full_path, 'r') as file:
-            sql = file.read()
-        try:
-            con.execute(sql)
-        except Exception as e:
-            raise
 
 def execute_SQL_file(con, file_path):
     """
@@ -41,12 +69,5 @@ def execute_SQL_file(con, file_path):
     - Exception: re-raises underlying execution errors.
     """
     full_path = os.path.join(parent_path, file_path)
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(full_path)
-
-    with open(full_path, 'r') as file:
-        sql = file.read()
-    try:
-        con.execute(sql)
-    except Exception as e:
-        raise
\ No newline at end of file
+    sql = _read_sql(full_path, os.stat(full_path).st_mtime_ns)
+    con.execute(sql)
\ No newline at end of file
@@ -1,5 +1,6 @@
-from .SQL import execute_SQL_file_list, execute_SQL_file
+from .SQL import execute_SQL_file_list, execute_SQL_file_list_batched, execute_SQL_file
 from .conversions import (
     convert_dataframe_to_parquet_stream,
+    convert_dataframe_to_arrow_ipc_stream,
     convert_dataframe_to_csv_stream
 )
\ No newline at end of file
@@ -1,23 +1,28 @@
 import io
 
-def convert_dataframe_to_parquet_stream(dataframe):
+def convert_dataframe_to_parquet_stream(dataframe, compression="zstd", compression_level=3, statistics=False, row_group_size=128 * 1024):
     buffer = io.BytesIO()
-    try:
-        dataframe.write_parquet(buffer)
-        buffer.seek(0)
-        result = buffer
-        return result
-    except Exception as e:
-        print(f"Error in converting dataframe to bytes stream: {e}")
-        raise
+    dataframe.write_parquet(
+        buffer,
+        compression=compression,
+        compression_level=compression_level,
+        statistics=statistics,
+        row_group_size=row_group_size,
+    )
+    buffer.seek(0)
+    return buffer
+
+def convert_dataframe_to_arrow_ipc_stream(dataframe, compression="uncompressed"):
+    # Arrow IPC is the fast path for moving a frame across a process
+    # boundary (Ray/Dask object stores, sockets): consumers can map it
+    # zero-copy. Use parquet instead for durable storage.
+    buffer = io.BytesIO()
+    dataframe.write_ipc_stream(buffer, compression=compression)
+    buffer.seek(0)
+    return buffer
 
 def convert_dataframe_to_csv_stream(dataframe):
     buffer = io.BytesIO()
-    try:
-        dataframe.write_csv(buffer)
-        buffer.seek(0)
-        result = buffer
-        return result
-    except Exception as e:
-        print(f"Error in converting dataframe to bytes stream: {e}")
-        raise
\ No newline at end of file
+    dataframe.write_csv(buffer)
+    buffer.seek(0)
+    return buffer
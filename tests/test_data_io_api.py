@@ -0,0 +1,32 @@
+
+from sushi_train.data_io.API import add_query_params_to_url
+
+
+def test_add_query_params_to_plain_url():
+	assert add_query_params_to_url("http://x", {"a": 1}) == "http://x?a=1"
+
+
+def test_add_query_params_to_empty_url():
+	assert add_query_params_to_url("", {"a": 1}) == "?a=1"
+
+
+def test_add_query_params_after_trailing_separator():
+	assert add_query_params_to_url("http://x?", {"a": 1}) == "http://x?a=1"
+	assert add_query_params_to_url("http://x?b=2&", {"a": 1}) == "http://x?b=2&a=1"
+
+
+def test_add_query_params_to_existing_query():
+	assert add_query_params_to_url("http://x?b=2", {"a": 1}) == "http://x?b=2&a=1"
+
+
+def test_add_query_params_skips_none_values():
+	assert add_query_params_to_url("http://x", {"a": 1, "b": None}) == "http://x?a=1"
+
+
+def test_add_query_params_all_none_returns_url_unchanged():
+	assert add_query_params_to_url("http://x", {"a": None, "b": None}) == "http://x"
+
+
+def test_add_query_params_empty_params_returns_url_unchanged():
+	assert add_query_params_to_url("http://x", {}) == "http://x"
+	assert add_query_params_to_url("http://x", None) == "http://x"
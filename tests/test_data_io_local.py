@@ -1,7 +1,8 @@
 
 import polars as pl
+import pytest
 
-from sushi-train.data_io.local import (
+from sushi_train.data_io.local import (
 	write_dataframe_to_local_csv,
 	read_local_csv_to_dataframe,
 	write_dataframe_to_local_parquet,
@@ -12,7 +13,7 @@ from sushi-train.data_io.local import (
 
 def assert_frames_equal(left: pl.DataFrame, right: pl.DataFrame):
 	assert left.to_dicts() == right.to_dicts()
-	
+
 
 def test_write_dataframe_to_local_csv(tmp_path):
 	df = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
@@ -23,7 +24,8 @@ def test_write_dataframe_to_local_csv(tmp_path):
 	assert file_path.stat().st_size > 0
 
 	bad_path = tmp_path / "bad.csv"
-	assert write_dataframe_to_local_csv(None, str(bad_path)) is None
+	with pytest.raises(AttributeError):
+		write_dataframe_to_local_csv(None, str(bad_path))
 	assert not bad_path.exists()
 
 
@@ -36,7 +38,8 @@ def test_read_local_csv_to_dataframe(tmp_path):
 	assert df2 is not None
 	assert_frames_equal(df, df2)
 
-	assert read_local_csv_to_dataframe(str(tmp_path / "no_such.csv")) is None
+	with pytest.raises(FileNotFoundError):
+		read_local_csv_to_dataframe(str(tmp_path / "no_such.csv"))
 
 
 def test_write_dataframe_to_local_parquet(tmp_path):
@@ -48,7 +51,8 @@ def test_write_dataframe_to_local_parquet(tmp_path):
 	assert file_path.stat().st_size > 0
 
 	bad_path = tmp_path / "bad.parquet"
-	assert write_dataframe_to_local_parquet(None, str(bad_path)) is None
+	with pytest.raises(AttributeError):
+		write_dataframe_to_local_parquet(None, str(bad_path))
 	assert not bad_path.exists()
 
 
@@ -61,7 +65,8 @@ def test_read_local_parquet_to_dataframe(tmp_path):
 	assert df2 is not None
 	assert_frames_equal(df, df2)
 
-	assert read_local_parquet_to_dataframe(str(tmp_path / "no_such.parquet")) is None
+	with pytest.raises(FileNotFoundError):
+		read_local_parquet_to_dataframe(str(tmp_path / "no_such.parquet"))
 
 
 def test_write_dataframe_to_local_json(tmp_path):
@@ -73,7 +78,8 @@ def test_write_dataframe_to_local_json(tmp_path):
 	assert file_path.stat().st_size > 0
 
 	bad_path = tmp_path / "bad.json"
-	assert write_dataframe_to_local_json(None, str(bad_path)) is None
+	with pytest.raises(AttributeError):
+		write_dataframe_to_local_json(None, str(bad_path))
 	assert not bad_path.exists()
 
 
@@ -86,4 +92,5 @@ def test_read_local_json_to_dataframe(tmp_path):
 	assert df2 is not None
 	assert_frames_equal(df, df2)
 
-	assert read_local_json_to_dataframe(str(tmp_path / "no_such.json")) is None
+	with pytest.raises(FileNotFoundError):
+		read_local_json_to_dataframe(str(tmp_path / "no_such.json"))
@@ -0,0 +1,67 @@
+import io
+
+import polars as pl
+import pytest
+
+from sushi_train.data_io.minio import (
+	write_dataframe_to_minio,
+	write_data_to_minio_from_parquet_buffer,
+)
+
+
+class FakeMinioClient:
+	def __init__(self):
+		self.calls = []
+
+	def put_object(self, bucket_name, object_name, data, length=None, part_size=None, content_type=None):
+		payload = data.read()
+		self.calls.append({
+			"bucket_name": bucket_name,
+			"object_name": object_name,
+			"data": payload,
+			"length": length,
+			"part_size": part_size,
+			"content_type": content_type,
+		})
+
+
+class FailingMinioClient:
+	def put_object(self, *args, **kwargs):
+		raise RuntimeError("upload failed")
+
+
+def test_write_dataframe_to_minio():
+	df = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+	client = FakeMinioClient()
+
+	write_dataframe_to_minio(df, client, "bucket", "test.parquet", folder_name="raw")
+
+	call = client.calls[0]
+	assert call["bucket_name"] == "bucket"
+	assert call["object_name"] == "raw/test.parquet"
+	assert call["length"] == -1
+	assert call["content_type"] == "application/x-parquet"
+	round_tripped = pl.read_parquet(io.BytesIO(call["data"]))
+	assert round_tripped.to_dicts() == df.to_dicts()
+
+
+def test_write_dataframe_to_minio_raises_upload_error():
+	df = pl.DataFrame({"id": [1, 2, 3]})
+
+	with pytest.raises(RuntimeError, match="upload failed"):
+		write_dataframe_to_minio(df, FailingMinioClient(), "bucket", "test.parquet")
+
+
+def test_write_data_to_minio_from_parquet_buffer():
+	df = pl.DataFrame({"id": [1, 2], "flag": [True, False]})
+	buffer = io.BytesIO()
+	df.write_parquet(buffer)
+	client = FakeMinioClient()
+
+	write_data_to_minio_from_parquet_buffer(buffer, client, "bucket", "test.parquet")
+
+	call = client.calls[0]
+	assert call["object_name"] == "test.parquet"
+	assert call["length"] == len(call["data"])
+	round_tripped = pl.read_parquet(io.BytesIO(call["data"]))
+	assert round_tripped.to_dicts() == df.to_dicts()